@@ -355,6 +355,8 @@ def create_graphrag_config(
                 aws_access_key_id=reader.str(Fragment.aws_access_key_id),
                 aws_secret_access_key=reader.str(Fragment.aws_secret_access_key),
                 region_name=reader.str(Fragment.region_name),
+                max_workers=reader.int(Fragment.max_workers),
+                hash_algorithm=reader.str(Fragment.hash_algorithm),
             )
         with reader.envvar_prefix(Section.cache), reader.use(values.get("cache")):
             c_type = reader.str(Fragment.type)
@@ -623,6 +625,8 @@ class Fragment(str, Enum):
     bucket_name = "BUCKET_NAME"
     base_prefix = "BASE_PREFIX"
     region_name = "REGION_NAME"
+    max_workers = "MAX_WORKERS"
+    hash_algorithm = "HASH_ALGORITHM"
 
 
 class Section(str, Enum):
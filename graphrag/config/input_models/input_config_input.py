@@ -30,3 +30,5 @@ class InputConfigInput(TypedDict):
     aws_access_key_id: NotRequired[str | None]
     aws_secret_access_key: NotRequired[str | None]
     region_name: NotRequired[str | None]
+    max_workers: NotRequired[int | str | None]
+    hash_algorithm: NotRequired[str | None]
@@ -3,6 +3,8 @@
 
 """Parameterization settings for the default configuration."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 import graphrag.config.defaults as defs
@@ -73,3 +75,12 @@ class InputConfig(BaseModel):
     region_name: str | None = Field(
         description="The aws region name to use.", default=None
     )
+    max_workers: int | None = Field(
+        description="The maximum number of concurrent S3 downloads to use.",
+        default=None,
+        gt=0,
+    )
+    hash_algorithm: Literal["md5", "blake2b"] | None = Field(
+        description="The hash algorithm to use for S3 input document ids.",
+        default=None,
+    )
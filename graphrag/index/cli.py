@@ -10,6 +10,7 @@ import platform
 import sys
 import time
 import warnings
+from dataclasses import asdict
 from pathlib import Path
 
 from graphrag.config import (
@@ -247,7 +248,7 @@ def _create_default_config(
     if verbose or dryrun:
         reporter.info(f"Using default configuration: {redact(parameters.model_dump())}")
     result = create_pipeline_config(parameters, verbose)
-    reporter.info(redact(result.storage.model_dump()))
+    reporter.info(redact(asdict(result.storage)))
     if verbose or dryrun:
         reporter.info(f"Final Config: {redact(result.model_dump())}")
 
@@ -278,9 +279,7 @@ def _read_config_parameters(root: str, config: str | None, reporter: ProgressRep
             import yaml
 
             data = yaml.safe_load(file.read().decode(encoding="utf-8", errors="strict"))
-            config = create_graphrag_config(data, root)
-            print(config)
-            return config
+            return create_graphrag_config(data, root)
 
     if settings_json.exists():
         reporter.success(f"Reading settings from {settings_json}")
@@ -95,7 +95,20 @@ class PipelineInputConfig(BaseModel, Generic[T]):
         description="The AWS region name for the S3 bucket.", default=None
     )
     """The AWS region name for the S3 bucket."""
-    
+
+    max_workers: int | None = pydantic_Field(
+        description="The maximum number of concurrent S3 downloads for the input files.",
+        default=None,
+        gt=0,
+    )
+    """The maximum number of concurrent S3 downloads for the input files."""
+
+    hash_algorithm: Literal["md5", "blake2b"] | None = pydantic_Field(
+        description="The hash algorithm used to generate ids for S3 input documents.",
+        default=None,
+    )
+    """The hash algorithm used to generate ids for S3 input documents."""
+
 
 class PipelineCSVInputConfig(PipelineInputConfig[Literal[InputFileType.csv]]):
     """Represent the configuration for a CSV input."""
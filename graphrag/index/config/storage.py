@@ -1,38 +1,41 @@
 # Copyright (c) 2024 Microsoft Corporation.
 # Licensed under the MIT License
 
-"""A module containing 'PipelineStorageConfig', 'PipelineFileStorageConfig', 'PipelineMemoryStorageConfig' and 'PipelineS3StorageConfig' models."""
+"""A module containing 'PipelineStorageConfig', 'PipelineFileStorageConfig', 'PipelineMemoryStorageConfig' and 'PipelineS3StorageConfig' models.
+
+These are plain frozen dataclasses rather than pydantic models; they are still
+validated when they appear as fields of the pydantic 'PipelineConfig'.
+"""
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Generic, Literal, TypeVar
 
-from pydantic import BaseModel
-from pydantic import Field as pydantic_Field
-
 from graphrag.config.enums import StorageType
 
 T = TypeVar("T")
 
 
-class PipelineStorageConfig(BaseModel, Generic[T]):
+@dataclass(slots=True, frozen=True)
+class PipelineStorageConfig(Generic[T]):
     """Represent the storage configuration for the pipeline."""
 
     type: T
 
 
+@dataclass(slots=True, frozen=True)
 class PipelineFileStorageConfig(PipelineStorageConfig[Literal[StorageType.file]]):
     """Represent the file storage configuration for the pipeline."""
 
     type: Literal[StorageType.file] = StorageType.file
     """The type of storage."""
 
-    base_dir: str | None = pydantic_Field(
-        description="The base directory for the storage.", default=None
-    )
+    base_dir: str | None = None
     """The base directory for the storage."""
 
 
+@dataclass(slots=True, frozen=True)
 class PipelineMemoryStorageConfig(PipelineStorageConfig[Literal[StorageType.memory]]):
     """Represent the memory storage configuration for the pipeline."""
 
@@ -40,56 +43,46 @@ class PipelineMemoryStorageConfig(PipelineStorageConfig[Literal[StorageType.memo
     """The type of storage."""
 
 
+@dataclass(slots=True, frozen=True)
 class PipelineBlobStorageConfig(PipelineStorageConfig[Literal[StorageType.blob]]):
     """Represents the blob storage configuration for the pipeline."""
 
     type: Literal[StorageType.blob] = StorageType.blob
     """The type of storage."""
 
-    connection_string: str | None = pydantic_Field(
-        description="The blob storage connection string for the storage.", default=None
-    )
+    connection_string: str | None = None
     """The blob storage connection string for the storage."""
 
-    container_name: str = pydantic_Field(
-        description="The container name for storage", default=None
-    )
+    container_name: str = None  # type: ignore
     """The container name for storage."""
 
-    base_dir: str | None = pydantic_Field(
-        description="The base directory for the storage.", default=None
-    )
+    base_dir: str | None = None
     """The base directory for the storage."""
 
-    storage_account_blob_url: str | None = pydantic_Field(
-        description="The storage account blob url.", default=None
-    )
+    storage_account_blob_url: str | None = None
     """The storage account blob url."""
 
 
+@dataclass(slots=True, frozen=True)
 class PipelineS3StorageConfig(PipelineStorageConfig[Literal[StorageType.s3]]):
     """Represents the S3 storage configuration for the pipeline."""
+
     type: Literal[StorageType.s3] = StorageType.s3
     """The type of storage."""
-    bucket_name: str = pydantic_Field(
-        description="The S3 bucket name for storage", default=None
-    )
+
+    bucket_name: str = None  # type: ignore
     """The S3 bucket name for storage."""
-    base_prefix: str | None = pydantic_Field(
-        description="The base prefix (folder) in the S3 bucket.", default=None
-    )
+
+    base_prefix: str | None = None
     """The base prefix (folder) in the S3 bucket."""
-    aws_access_key_id: str | None = pydantic_Field(
-        description="The AWS access key ID.", default=None
-    )
+
+    aws_access_key_id: str | None = None
     """The AWS access key ID."""
-    aws_secret_access_key: str | None = pydantic_Field(
-        description="The AWS secret access key.", default=None
-    )
+
+    aws_secret_access_key: str | None = None
     """The AWS secret access key."""
-    region_name: str | None = pydantic_Field(
-        description="The AWS region name.", default=None
-    )
+
+    region_name: str | None = None
     """The AWS region name."""
 
 
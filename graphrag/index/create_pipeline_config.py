@@ -485,7 +485,8 @@ def _get_pipeline_input_config(
                 aws_access_key_id=settings.input.aws_access_key_id,
                 aws_secret_access_key=settings.input.aws_secret_access_key,
                 region_name=settings.input.region_name,
-
+                max_workers=settings.input.max_workers,
+                hash_algorithm=settings.input.hash_algorithm,
             )
         case _:
             msg = f"Unknown input type: {file_type}"
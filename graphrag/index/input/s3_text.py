@@ -2,18 +2,24 @@
 # Licensed under the MIT License
 """A module containing load method definition for S3 text input."""
 
+import asyncio
 import logging
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b, md5
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
-import boto3
-from botocore.exceptions import ClientError
+from datashaper import Progress
 
 from graphrag.index.config import PipelineInputConfig
 from graphrag.index.progress import ProgressReporter
-from graphrag.index.utils import gen_md5_hash
+from graphrag.index.storage.s3_pipeline_storage import (
+    get_max_pool_connections,
+    get_s3_client,
+)
 
 input_type = "s3_text"
 log = logging.getLogger(__name__)
@@ -21,6 +27,21 @@ log = logging.getLogger(__name__)
 DEFAULT_FILE_PATTERN = re.compile(
     r".*[\\/](?P<source>[^\\/]+)[\\/](?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})_(?P<author>[^_]+)_\d+\.txt"
 )
+DEFAULT_MAX_WORKERS = 32
+
+
+def _create_hasher(algorithm: str) -> Callable[[bytes], str]:
+    """Create a hex-digest function for document ids."""
+    match algorithm:
+        case "md5":
+            return lambda data: md5(data, usedforsecurity=False).hexdigest()
+        case "blake2b":
+            # 16-byte digests keep ids the same length as md5 ones
+            return lambda data: blake2b(data, digest_size=16).hexdigest()
+        case _:
+            msg = f"Unknown hash algorithm: {algorithm}"
+            raise ValueError(msg)
+
 
 async def load(
     config: PipelineInputConfig,
@@ -31,23 +52,30 @@ async def load(
     if not config.bucket_name or not config.base_prefix:
         raise ValueError("S3 bucket name and base prefix are required for S3 input")
 
-    s3 = boto3.client('s3')
+    # A single client is shared by all download threads; boto3 clients are thread-safe.
+    max_workers = (
+        DEFAULT_MAX_WORKERS if config.max_workers is None else config.max_workers
+    )
+    s3 = get_s3_client(
+        config.region_name,
+        config.aws_access_key_id,
+        config.aws_secret_access_key,
+        max(get_max_pool_connections(), max_workers),
+    )
 
-    async def load_file(key: str, group: dict | None = None) -> dict[str, Any]:
-        if group is None:
-            group = {}
-        try:
-            obj = s3.get_object(Bucket=config.bucket_name, Key=key)
-            text = obj['Body'].read().decode('utf-8')
-            new_item = {**group, "text": text}
-            new_item["id"] = gen_md5_hash(new_item, new_item.keys())
-            new_item["title"] = str(Path(key).name)
-            return new_item
-        except ClientError as e:
-            log.error(f"Error reading file {key} from S3: {e}")
-            raise
-
-    file_pattern = re.compile(config.file_pattern or DEFAULT_FILE_PATTERN)
+    # Decoding happens here on the download threads, off the event loop. A process
+    # pool would not help: the decoded str is pickled back as UTF-8 and decoded again.
+    def fetch_file(key: str) -> str:
+        obj = s3.get_object(Bucket=config.bucket_name, Key=key)
+        return obj["Body"].read().decode(config.encoding or "utf-8")
+
+    file_pattern = (
+        config.file_pattern
+        if isinstance(config.file_pattern, re.Pattern)
+        else re.compile(config.file_pattern)
+        if config.file_pattern
+        else DEFAULT_FILE_PATTERN
+    )
 
     try:
         paginator = s3.get_paginator('list_objects_v2')
@@ -67,18 +95,74 @@ async def load(
 
         log.info(f"Found {len(files)} text files in S3 bucket {config.bucket_name}")
 
-        files_loaded = []
-        for file, group in files:
-            if progress:
-                progress.report_progress(f"Loading file: {file}")
-            try:
-                files_loaded.append(await load_file(file, group))
-            except Exception:
-                log.warning(f"Warning! Error loading file {file} from S3. Skipping...")
+        loop = asyncio.get_running_loop()
+        texts: list[str | None] = [None] * len(files)
+        # Shut down without waiting: if load() is cancelled or fails, queued downloads
+        # are dropped instead of blocking the event loop until they all finish
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                loop.run_in_executor(executor, fetch_file, file): i
+                for i, (file, _group) in enumerate(files)
+            }
+            pending = set(futures)
+            num_done = 0
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    i = futures[future]
+                    file = files[i][0]
+                    try:
+                        texts[i] = future.result()
+                    except Exception:  # noqa: BLE001 (catching Exception is fine here)
+                        log.warning(f"Warning! Error loading file {file} from S3. Skipping...")
+                    num_done += 1
+                    if progress is not None:
+                        progress(
+                            Progress(
+                                total_items=len(files),
+                                completed_items=num_done,
+                                description=f"Loading file: {file}",
+                            )
+                        )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Build the frame column-wise, keeping the listing order regardless of the
+        # order downloads completed in
+        loaded = [
+            (file, group, text)
+            for (file, group), text in zip(files, texts, strict=True)
+            if text is not None
+        ]
+        columns: dict[str, list[Any]] = {name: [] for name in files[0][1]}
+        for _file, group, _text in loaded:
+            for name, value in group.items():
+                columns[name].append(value)
+
+        # Same input as gen_md5_hash over the group values followed by the text,
+        # so md5 ids match the ones produced by the other loaders
+        hasher = _create_hasher(config.hash_algorithm or "md5")
+        ids = [
+            hasher("".join([*map(str, group.values()), text]).encode("utf-8"))
+            for _file, group, text in loaded
+        ]
 
-        log.info(f"Found {len(files)} files, loading {len(files_loaded)}")
-        return pd.DataFrame(files_loaded)
+        log.info(f"Found {len(files)} files, loading {len(loaded)}")
+        # Every column holds strings; Arrow-backed storage keeps them in contiguous
+        # buffers instead of one Python object per cell
+        return pd.DataFrame(
+            {
+                **columns,
+                "text": [text for _, _, text in loaded],
+                "id": ids,
+                "title": [str(Path(file).name) for file, _, _ in loaded],
+            },
+            dtype="string[pyarrow]",
+        )
 
-    except ClientError as e:
+    except s3.exceptions.ClientError as e:
         log.error(f"Error accessing S3: {e}")
-        raise
\ No newline at end of file
+        raise
@@ -9,7 +9,7 @@ import logging
 import time
 import traceback
 from collections.abc import AsyncIterable
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from io import BytesIO
 from pathlib import Path
 from string import Template
@@ -146,7 +146,7 @@ async def run_pipeline_with_config(
         config.input
     )
     workflows = workflows or config.workflows
-    print(f"dataset: {dataset}")
+    log.debug("dataset: %s", dataset)
     if dataset is None:
         msg = "No dataset provided!"
         raise ValueError(msg)
@@ -426,8 +426,9 @@ def _apply_substitutions(config: PipelineConfig, run_id: str) -> PipelineConfig:
         )
         and config.storage.base_dir
     ):
-        config.storage.base_dir = Template(config.storage.base_dir).substitute(
-            substitutions
+        config.storage = replace(
+            config.storage,
+            base_dir=Template(config.storage.base_dir).substitute(substitutions),
         )
     if (
         isinstance(config.cache, PipelineFileCacheConfig | PipelineBlobCacheConfig)
@@ -5,49 +5,71 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import cast
 
 from graphrag.config import StorageType
 from graphrag.index.config.storage import (
     PipelineBlobStorageConfig,
     PipelineFileStorageConfig,
+    PipelineMemoryStorageConfig,
+    PipelineS3StorageConfig,
     PipelineStorageConfig,
-    PipelineS3StorageConfig
 )
 
 from .blob_pipeline_storage import create_blob_storage
 from .file_pipeline_storage import create_file_storage
-from .s3_pipeline_storage import create_s3_storage
 from .memory_pipeline_storage import create_memory_storage
+from .typing import PipelineStorage
+
+
+def _create_memory_storage(_config: PipelineMemoryStorageConfig) -> PipelineStorage:
+    return create_memory_storage()
+
+
+def _create_blob_storage(config: PipelineBlobStorageConfig) -> PipelineStorage:
+    return create_blob_storage(
+        config.connection_string,
+        config.storage_account_blob_url,
+        config.container_name,
+        config.base_dir,
+    )
+
+
+def _create_file_storage(config: PipelineFileStorageConfig) -> PipelineStorage:
+    return create_file_storage(config.base_dir)
+
+
+def _create_s3_storage(config: PipelineS3StorageConfig) -> PipelineStorage:
+    # boto3 is only imported when S3 storage is actually used
+    from .s3_pipeline_storage import create_s3_storage
+
+    return create_s3_storage(
+        config.aws_access_key_id,
+        config.aws_secret_access_key,
+        config.bucket_name,
+        config.base_prefix,
+        config.region_name,
+    )
+
+
+_storage_factories = {
+    StorageType.memory: _create_memory_storage,
+    StorageType.blob: _create_blob_storage,
+    StorageType.file: _create_file_storage,
+    StorageType.s3: _create_s3_storage,
+}
 
 
 def load_storage(config: PipelineStorageConfig):
     """Load the storage for a pipeline."""
-    match config.type:
-        case StorageType.memory:
-            return create_memory_storage()
-        case StorageType.blob:
-            config = cast(PipelineBlobStorageConfig, config)
-            return create_blob_storage(
-                config.connection_string,
-                config.storage_account_blob_url,
-                config.container_name,
-                config.base_dir,
-            )
-        case StorageType.file:
-            config = cast(PipelineFileStorageConfig, config)
-            return create_file_storage(config.base_dir)
-        
-        case StorageType.s3:
-            config = cast(PipelineS3StorageConfig, config)
-            print(f"config 2: {config}")
-            return create_s3_storage(
-                config.aws_access_key_id,
-                config.aws_secret_access_key,
-                config.bucket_name,
-                config.base_prefix,
-                config.region_name,
-            )
-        case _:
-            msg = f"Unknown storage type: {config.type}"
-            raise ValueError(msg)
+    try:
+        # Each factory takes the config class matching its storage type
+        factory = cast(
+            Callable[[PipelineStorageConfig], PipelineStorage],
+            _storage_factories[config.type],
+        )
+    except KeyError:
+        msg = f"Unknown storage type: {config.type}"
+        raise ValueError(msg) from None
+    return factory(config)
@@ -1,10 +1,18 @@
+import asyncio
 import logging
+import os
+import queue
 import re
-from collections.abc import Iterator
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
 from typing import Any, cast
 
-import boto3
-from botocore.exceptions import ClientError
 from datashaper import Progress
 
 from graphrag.index.progress import ProgressReporter
@@ -13,6 +21,82 @@ from .typing import PipelineStorage
 
 log = logging.getLogger(__name__)
 
+DEFAULT_CHUNKSIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_POOL_CONNECTIONS = 64
+MAX_POOL_CONNECTIONS_ENV = "GRAPHRAG_S3_MAX_POOL"
+DEFAULT_CLEAR_CONCURRENCY = 16
+DEFAULT_EXISTS_TTL = 5.0
+DEFAULT_EXISTS_CACHE_SIZE = 4096
+
+
+def get_max_pool_connections() -> int:
+    """Get the S3 connection pool size, which can be overridden with GRAPHRAG_S3_MAX_POOL."""
+    value = os.environ.get(MAX_POOL_CONNECTIONS_ENV)
+    if value is None:
+        return DEFAULT_MAX_POOL_CONNECTIONS
+    try:
+        max_pool_connections = int(value)
+    except ValueError:
+        max_pool_connections = 0
+    if max_pool_connections < 1:
+        msg = f"{MAX_POOL_CONNECTIONS_ENV} must be a positive integer, got {value!r}"
+        raise ValueError(msg)
+    return max_pool_connections
+
+
+@lru_cache(maxsize=8)
+def get_s3_client(
+    region_name: str | None,
+    aws_access_key_id: str | None,
+    aws_secret_access_key: str | None,
+    max_pool_connections: int | None = None,
+) -> Any:
+    """Get a shared S3 client for the given credentials.
+
+    Sessions are not thread-safe, but the clients they create are, so a single
+    client (and its connection pool) is reused by every S3 storage and input.
+    The pool must be at least as large as the number of threads using the client,
+    otherwise they serialize on connection acquisition.
+    """
+    # boto3 is imported on first use so that non-S3 pipelines don't pay its import cost
+    import boto3
+    from botocore.config import Config
+
+    return boto3.session.Session(
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=region_name,
+    ).client(
+        "s3",
+        config=Config(
+            max_pool_connections=max_pool_connections or get_max_pool_connections(),
+            retries={"mode": "adaptive", "max_attempts": 10},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+@lru_cache(maxsize=8)
+def get_transfer_manager(client: Any, chunksize: int, max_concurrency: int) -> Any:
+    """Get the transfer manager used for multipart uploads, shared per client and settings.
+
+    Each manager owns a thread pool for the life of the process, so storage
+    instances (including every child()) reuse one instead of creating their own.
+    """
+    from boto3.s3.transfer import TransferConfig, create_transfer_manager
+
+    return create_transfer_manager(
+        client,
+        TransferConfig(
+            multipart_threshold=chunksize,
+            multipart_chunksize=chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=max_concurrency > 1,
+        ),
+    )
+
+
 class S3PipelineStorage(PipelineStorage):
     """S3 storage class definition."""
 
@@ -21,13 +105,23 @@ class S3PipelineStorage(PipelineStorage):
                  aws_secret_access_key: str | None = None, 
                  bucket_name: str | None = None,
                  base_prefix: str | None = None, 
-                 region_name: str | None = None):
+                 region_name: str | None = None,
+                 chunksize: int = DEFAULT_CHUNKSIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 client: Any | None = None):
         """Init method definition."""
         self.bucket_name = bucket_name
-        print(f"bucket_name: {bucket_name}")
         self.base_prefix = base_prefix or ""
-        print(f"base_prefix: {base_prefix}")
-        self.s3 = boto3.client("s3")
+        self.chunksize = chunksize
+        self.max_concurrency = max_concurrency
+        self.s3 = client or get_s3_client(
+            region_name,
+            aws_access_key_id,
+            aws_secret_access_key,
+            max(get_max_pool_connections(), max_concurrency * 2),
+        )
+        self._exists_cache: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self._exists_ttl = DEFAULT_EXISTS_TTL
 
     def find(
         self,
@@ -36,86 +130,258 @@ class S3PipelineStorage(PipelineStorage):
         progress: ProgressReporter | None = None,
         file_filter: dict[str, Any] | None = None,
         max_count=-1,
+        list_shards: list[str] | None = None,
     ) -> Iterator[tuple[str, dict[str, Any]]]:
-        """Find files in the S3 bucket using a file pattern, as well as a custom filter function."""
+        """Find files in the S3 bucket using a file pattern, as well as a custom filter function.
+
+        When list_shards is given, the search prefix is listed concurrently as one
+        sub-prefix per shard (e.g. the hex digits "0"-"f"); keys under the search
+        prefix that do not start with one of the shards are not listed.
+        """
         search_prefix = f"{self.base_prefix}/{base_dir}" if base_dir else self.base_prefix
-        paginator = self.s3.get_paginator('list_objects_v2')
-        
-        num_loaded = 0
-        num_filtered = 0
-        num_total = 0
-
-        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=search_prefix):
-            for obj in page.get('Contents', []):
-                num_total += 1
-                key = obj['Key']
-                match = file_pattern.match(key)
-                if match:
-                    group = match.groupdict()
-                    if file_filter is None or all(re.match(value, group[key]) for key, value in file_filter.items()):
-                        yield (key, group)
-                        num_loaded += 1
-                        if max_count > 0 and num_loaded >= max_count:
-                            return
-                    else:
-                        num_filtered += 1
-                else:
-                    num_filtered += 1
+        state = _FindState(file_pattern, _FileFilter(file_filter), progress, max_count)
 
-                if progress is not None:
-                    progress(_create_progress_status(num_loaded, num_filtered, num_total))
+        for page in self._list_pages(search_prefix, list_shards):
+            yield from self._match_page(page, state)
+            if state.done:
+                return
+
+    async def afind(
+        self,
+        file_pattern: re.Pattern[str],
+        base_dir: str | None = None,
+        progress: ProgressReporter | None = None,
+        file_filter: dict[str, Any] | None = None,
+        max_count=-1,
+        list_shards: list[str] | None = None,
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Asynchronously find files in the S3 bucket, see find().
+
+        The next listing page is fetched on a worker thread while the consumer
+        processes the current one, so listing round-trips overlap with its work.
+        """
+        search_prefix = f"{self.base_prefix}/{base_dir}" if base_dir else self.base_prefix
+        state = _FindState(file_pattern, _FileFilter(file_filter), progress, max_count)
+
+        pages = self._list_pages(search_prefix, list_shards)
+        next_page = asyncio.ensure_future(asyncio.to_thread(next, pages, None))
+        try:
+            while (page := await next_page) is not None:
+                next_page = asyncio.ensure_future(asyncio.to_thread(next, pages, None))
+                for item in self._match_page(page, state):
+                    yield item
+                if state.done:
+                    return
+        finally:
+            # The page generator cannot be closed while a prefetch is running it
+            await asyncio.wait([next_page])
+            pages.close()
+
+    def _match_page(
+        self, page: list[dict[str, Any]], state: "_FindState"
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield the matching keys of one listing page, stopping once state.max_count is reached."""
+        for obj in page:
+            state.num_total += 1
+            key = obj["Key"]
+            group = _match_key(key, state.file_pattern, state.file_filter)
+            if group is not None:
+                self._cache_exists(key, True)
+                yield (key, group)
+                state.num_loaded += 1
+                if state.done:
+                    return
+            else:
+                state.num_filtered += 1
+
+            if state.progress is not None:
+                state.progress(
+                    _create_progress_status(state.num_loaded, state.num_filtered, state.num_total)
+                )
+
+    def _list_pages(
+        self, search_prefix: str, list_shards: list[str] | None = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """List the objects under a prefix page by page, optionally fanning out over sub-prefix shards."""
+        paginator = self.s3.get_paginator("list_objects_v2")
+        if not list_shards:
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=search_prefix):
+                yield page.get("Contents", [])
+            return
+
+        results: queue.Queue = queue.Queue()
+        done = object()
+        stopped = threading.Event()
+
+        def list_shard(shard: str) -> None:
+            prefix = f"{search_prefix}/{shard}" if search_prefix else shard
+            try:
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                    if stopped.is_set():
+                        break
+                    results.put(page.get("Contents", []))
+            except Exception as e:  # noqa: BLE001 (re-raised by the consumer)
+                results.put(e)
+            finally:
+                results.put(done)
+
+        executor = ThreadPoolExecutor(max_workers=len(list_shards))
+        try:
+            for shard in list_shards:
+                executor.submit(list_shard, shard)
+            remaining = len(list_shards)
+            while remaining:
+                item = results.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     async def get(self, key: str, as_bytes: bool | None = False, encoding: str | None = None) -> Any:
         """Get method definition."""
-        full_key = f"{self.base_prefix}/{key}" if self.base_prefix else key
-        # Temporal solution s3_text
-         # Check for duplicate base prefix and adjust if necessary
-        if full_key.count(self.base_prefix) > 1:
-            full_key = full_key.replace(f"{self.base_prefix}/", "", 1)
-        try:
-            response = self.s3.get_object(Bucket=self.bucket_name, Key=full_key)
-            data = response['Body'].read()
+        full_key = self._keyname(key)
+
+        def read() -> str | bytes:
+            data = self._read_object(full_key)
             if as_bytes:
                 return data
             return data.decode(encoding or 'utf-8')
-        except ClientError as e:
+
+        try:
+            # Download and decode on a worker thread so large payloads don't stall the event loop
+            return await asyncio.to_thread(read)
+        except self.s3.exceptions.ClientError as e:
             log.error(f"Error fetching object from S3: {e.response['Error']['Message']}")
-            print(f"Error fetching object from S3: {e.response['Error']['Message']}")
             if e.response['Error']['Code'] == 'NoSuchKey':
 
                 return None
             raise
 
+    def _read_object(self, full_key: str) -> bytes:
+        """Read an object, splitting large objects into concurrent ranged GETs."""
+        if self.max_concurrency <= 1:
+            response = self.s3.get_object(Bucket=self.bucket_name, Key=full_key)
+            return response["Body"].read()
+
+        # The first range doubles as the size probe, so small objects cost a single request
+        try:
+            response = self.s3.get_object(
+                Bucket=self.bucket_name,
+                Key=full_key,
+                Range=f"bytes=0-{self.chunksize - 1}",
+            )
+        except self.s3.exceptions.ClientError as e:
+            # Ranged reads of zero-length objects are rejected
+            if e.response["Error"]["Code"] == "InvalidRange":
+                return b""
+            raise
+        head = response["Body"].read()
+        size = int(response["ContentRange"].rsplit("/", 1)[1])
+        if size <= self.chunksize:
+            return head
+        # Pin the remaining ranges to the version read above, so an overwrite mid-read
+        # fails with PreconditionFailed instead of stitching two versions together
+        etag = response["ETag"]
+
+        ranges = [
+            (start, min(start + self.chunksize, size) - 1)
+            for start in range(self.chunksize, size, self.chunksize)
+        ]
+
+        def read_range(byte_range: tuple[int, int]) -> bytes:
+            start, end = byte_range
+            response = self.s3.get_object(
+                Bucket=self.bucket_name,
+                Key=full_key,
+                Range=f"bytes={start}-{end}",
+                IfMatch=etag,
+            )
+            return response["Body"].read()
+
+        buffer = bytearray(size)
+        buffer[: len(head)] = head
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for (start, end), chunk in zip(
+                ranges, executor.map(read_range, ranges), strict=True
+            ):
+                buffer[start : end + 1] = chunk
+        return bytes(buffer)
+
     async def set(self, key: str, value: Any, encoding: str | None = None) -> None:
         """Set method definition."""
-        full_key = f"{self.base_prefix}/{key}" if self.base_prefix else key
-        if isinstance(value, bytes):
-            self.s3.put_object(Bucket=self.bucket_name, Key=full_key, Body=value)
-        else:
-            encoded_value = value.encode(encoding or 'utf-8') if isinstance(value, str) else value
-            self.s3.put_object(Bucket=self.bucket_name, Key=full_key, Body=encoded_value)
+        full_key = self._keyname(key)
+        if not isinstance(value, bytes):
+            value = value.encode(encoding or 'utf-8') if isinstance(value, str) else value
+
+        def write() -> None:
+            if isinstance(value, bytes) and len(value) > self.chunksize:
+                # Large values go through a concurrent multipart upload
+                get_transfer_manager(self.s3, self.chunksize, self.max_concurrency).upload(
+                    fileobj=BytesIO(value), bucket=self.bucket_name, key=full_key
+                ).result()
+            else:
+                self.s3.put_object(Bucket=self.bucket_name, Key=full_key, Body=value)
+
+        # Upload on a worker thread so large payloads don't stall the event loop
+        await asyncio.to_thread(write)
+        self._exists_cache.pop(full_key, None)
 
     async def has(self, key: str) -> bool:
         """Has method definition."""
-        full_key = f"{self.base_prefix}/{key}" if self.base_prefix else key
+        full_key = self._keyname(key)
+        cached = self._exists_cache.get(full_key)
+        if cached is not None and cached[1] > time.monotonic():
+            self._exists_cache.move_to_end(full_key)
+            return cached[0]
         try:
             self.s3.head_object(Bucket=self.bucket_name, Key=full_key)
-            return True
-        except ClientError:
-            return False
+            exists = True
+        except self.s3.exceptions.ClientError:
+            exists = False
+        self._cache_exists(full_key, exists)
+        return exists
+
+    def _cache_exists(self, full_key: str, exists: bool) -> None:
+        """Remember whether a key exists for the next few seconds, evicting the least recently used entry."""
+        self._exists_cache[full_key] = (exists, time.monotonic() + self._exists_ttl)
+        self._exists_cache.move_to_end(full_key)
+        if len(self._exists_cache) > DEFAULT_EXISTS_CACHE_SIZE:
+            self._exists_cache.popitem(last=False)
 
     async def delete(self, key: str) -> None:
         """Delete method definition."""
-        full_key = f"{self.base_prefix}/{key}" if self.base_prefix else key
+        full_key = self._keyname(key)
         self.s3.delete_object(Bucket=self.bucket_name, Key=full_key)
+        self._exists_cache.pop(full_key, None)
 
     async def clear(self) -> None:
         """Clear method definition."""
-        paginator = self.s3.get_paginator('list_objects_v2')
-        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.base_prefix):
-            delete_keys = {'Objects': [{'Key': obj['Key']} for obj in page.get('Contents', [])]}
-            if delete_keys['Objects']:
-                self.s3.delete_objects(Bucket=self.bucket_name, Delete=delete_keys)
+        self._exists_cache.clear()
+        def delete_page(objects: list[dict[str, str]]) -> None:
+            response = self.s3.delete_objects(
+                Bucket=self.bucket_name, Delete={"Objects": objects}
+            )
+            for error in response.get("Errors", []):
+                log.warning("Error deleting %s from S3: %s", error.get("Key"), error.get("Message"))
+
+        # Each page holds at most 1000 keys, the delete_objects limit, so pages are
+        # deleted as they are listed while the next page is being fetched
+        paginator = self.s3.get_paginator("list_objects_v2")
+        with ThreadPoolExecutor(max_workers=DEFAULT_CLEAR_CONCURRENCY) as executor:
+            futures = [
+                executor.submit(
+                    delete_page, [{"Key": obj["Key"]} for obj in page["Contents"]]
+                )
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.base_prefix)
+                if page.get("Contents")
+            ]
+            for future in futures:
+                future.result()
 
     def child(self, name: str | None) -> "PipelineStorage":
         """Create a child storage instance."""
@@ -123,13 +389,21 @@ class S3PipelineStorage(PipelineStorage):
             return self
         new_prefix = f"{self.base_prefix}/{name}" if self.base_prefix else name
         return S3PipelineStorage(
-            aws_access_key_id=self.s3.meta.client.meta.config.credentials.access_key,
-            aws_secret_access_key=self.s3.meta.client.meta.config.credentials.secret_key,
             bucket_name=self.bucket_name,
             base_prefix=new_prefix,
-            region_name=self.s3.meta.client.meta.region_name
+            chunksize=self.chunksize,
+            max_concurrency=self.max_concurrency,
+            client=self.s3,
         )
 
+    def _keyname(self, key: str) -> str:
+        """Get the key name, accepting keys that already carry the base prefix (e.g. from find())."""
+        if not self.base_prefix:
+            return key
+        if key.startswith(f"{self.base_prefix}/"):
+            return key
+        return f"{self.base_prefix}/{key}"
+
 def create_s3_storage(
     
         aws_access_key_id: str | None = None, 
@@ -147,6 +421,101 @@ def create_s3_storage(
         region_name=region_name
     )
 
+def _match_key(
+    key: str, file_pattern: re.Pattern[str], compiled_filter: "_FileFilter"
+) -> dict[str, Any] | None:
+    """Match a key against the file pattern and filter, returning its groups if it passes."""
+    match = file_pattern.match(key)
+    if match is None:
+        return None
+    group = match.groupdict()
+    if compiled_filter.matches(group):
+        return group
+    return None
+
+
+@dataclass
+class _FindState:
+    """The matching options and running counts of a single find() or afind() call."""
+
+    file_pattern: re.Pattern[str]
+    file_filter: "_FileFilter"
+    progress: ProgressReporter | None
+    max_count: int
+    num_loaded: int = 0
+    num_filtered: int = 0
+    num_total: int = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether max_count keys have been found."""
+        return self.max_count > 0 and self.num_loaded >= self.max_count
+
+
+@dataclass(slots=True)
+class _FieldFilter:
+    """The pattern for one filtered field and its running pass rate."""
+
+    field: str
+    pattern: re.Pattern[str]
+    hits: int = 0
+    total: int = 0
+
+    @property
+    def pass_rate(self) -> float:
+        """The fraction of checked values that matched, 1.0 before any check."""
+        return self.hits / self.total if self.total else 1.0
+
+
+class _FileFilter:
+    """A compiled file filter that checks its most selective fields first.
+
+    Pass rates are tracked per field and the fields are reordered every
+    reorder_interval checks, so most rejected keys fail on the first pattern.
+    """
+
+    def __init__(self, file_filter: dict[str, Any] | None, reorder_interval: int = 4096):
+        self._filters = [
+            _FieldFilter(field, pattern)
+            for field, pattern in _compile_file_filter(file_filter).items()
+        ]
+        self._reorder_interval = reorder_interval
+        self._checked = 0
+
+    @property
+    def fields(self) -> list[str]:
+        """The filtered fields, in the order they are currently checked."""
+        return [field_filter.field for field_filter in self._filters]
+
+    def matches(self, group: dict[str, Any]) -> bool:
+        """Return True if the group passes every pattern of the filter."""
+        filters = self._filters
+        if len(filters) == 1:
+            return filters[0].pattern.match(group[filters[0].field]) is not None
+
+        self._checked += 1
+        if self._checked % self._reorder_interval == 0:
+            filters.sort(key=lambda field_filter: field_filter.pass_rate)
+        for field_filter in filters:
+            field_filter.total += 1
+            if not field_filter.pattern.match(group[field_filter.field]):
+                return False
+            field_filter.hits += 1
+        return True
+
+
+def _compile_file_filter(
+    file_filter: dict[str, Any] | None,
+) -> dict[str, re.Pattern[str]]:
+    """Compile a file filter once, fusing a list of patterns for a field into a single alternation."""
+    compiled = {}
+    for field, value in (file_filter or {}).items():
+        if isinstance(value, list | tuple):
+            value = "|".join(f"(?:{pattern})" for pattern in value)
+        compiled[field] = re.compile(value)
+    return compiled
+
+
 def _create_progress_status(num_loaded: int, num_filtered: int, num_total: int) -> Progress:
     return Progress(
         total_items=num_total,
@@ -524,6 +524,15 @@ class TestDefaultConfig(unittest.TestCase):
         with pytest.raises(ValidationError):
             create_graphrag_config(cast(Any, {"llm": 12}))
 
+    @mock.patch.dict(
+        os.environ,
+        {"GRAPHRAG_API_KEY": "test", "GRAPHRAG_INPUT_MAX_WORKERS": "0"},
+        clear=True,
+    )
+    def test_non_positive_input_max_workers_throws(self):
+        with pytest.raises(ValidationError):
+            create_graphrag_config()
+
     @mock.patch.dict(
         os.environ,
         ALL_ENV_VARS,
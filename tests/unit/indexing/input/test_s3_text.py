@@ -0,0 +1,114 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""S3 Text Input Tests."""
+
+import io
+import time
+from hashlib import blake2b
+
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
+
+from graphrag.index.config import PipelineTextInputConfig
+from graphrag.index.input.s3_text import DEFAULT_MAX_WORKERS, load
+from graphrag.index.storage.s3_pipeline_storage import (
+    get_max_pool_connections,
+    get_s3_client,
+)
+from graphrag.index.utils import gen_md5_hash
+
+FILE_PATTERN = r".*/(?P<source>[^/]+)/(?P<year>\d{4})_\d+\.txt$"
+
+
+def _config(**kwargs) -> PipelineTextInputConfig:
+    return PipelineTextInputConfig(
+        file_pattern=FILE_PATTERN,
+        bucket_name="bucket",
+        base_prefix="input",
+        region_name="us-east-1",
+        **kwargs,
+    )
+
+
+async def _load(
+    config: PipelineTextInputConfig, objects: dict[str, bytes | None], delays=None
+):
+    """Run load() against a bucket holding objects; None marks an object whose GET fails."""
+    # The same cached client load() will use
+    client = get_s3_client(
+        config.region_name,
+        config.aws_access_key_id,
+        config.aws_secret_access_key,
+        max(get_max_pool_connections(), DEFAULT_MAX_WORKERS),
+    )
+    delays = delays or {}
+
+    def list_objects(**_kwargs):
+        return AWSResponse(None, 200, {}, None), {
+            "Contents": [{"Key": key} for key in objects],
+            "IsTruncated": False,
+        }
+
+    def get_object(params, **_kwargs):
+        key = params["url_path"].removeprefix("/")
+        time.sleep(delays.get(key, 0))
+        data = objects[key]
+        if data is None:
+            return AWSResponse(None, 404, {}, None), {
+                "Error": {"Code": "NoSuchKey", "Message": "missing"},
+                "ResponseMetadata": {"HTTPStatusCode": 404},
+            }
+        return AWSResponse(None, 200, {}, None), {
+            "Body": StreamingBody(io.BytesIO(data), len(data))
+        }
+
+    client.meta.events.register("before-call.s3.ListObjectsV2", list_objects)
+    client.meta.events.register("before-call.s3.GetObject", get_object)
+    try:
+        return await load(config, None, None)
+    finally:
+        client.meta.events.unregister("before-call.s3.ListObjectsV2", list_objects)
+        client.meta.events.unregister("before-call.s3.GetObject", get_object)
+
+
+async def test_load_keeps_listing_order():
+    objects = {
+        "input/news/2020_1.txt": b"first",
+        "input/news/2020_2.txt": b"second",
+        "input/blog/2021_3.txt": b"third",
+    }
+    # The first download finishes last
+    output = await _load(_config(), objects, delays={"input/news/2020_1.txt": 0.2})
+    assert output["text"].tolist() == ["first", "second", "third"]
+    assert output["title"].tolist() == ["2020_1.txt", "2020_2.txt", "2021_3.txt"]
+    assert output["source"].tolist() == ["news", "news", "blog"]
+
+
+async def test_load_skips_failed_files():
+    objects = {
+        "input/news/2020_1.txt": b"first",
+        "input/news/2020_2.txt": None,
+        "input/news/2020_3.txt": b"third",
+    }
+    output = await _load(_config(), objects)
+    assert output["title"].tolist() == ["2020_1.txt", "2020_3.txt"]
+
+
+async def test_load_md5_ids_match_gen_md5_hash():
+    output = await _load(_config(), {"input/news/2020_1.txt": b"Hello, World!"})
+    item = {"source": "news", "year": "2020", "text": "Hello, World!"}
+    assert output["id"].tolist() == [gen_md5_hash(item, item.keys())]
+
+
+async def test_load_blake2b_ids():
+    output = await _load(
+        _config(hash_algorithm="blake2b"), {"input/news/2020_1.txt": b"Hello, World!"}
+    )
+    expected = blake2b(b"news2020Hello, World!", digest_size=16).hexdigest()
+    assert output["id"].tolist() == [expected]
+
+
+async def test_load_arrow_string_columns():
+    output = await _load(_config(), {"input/news/2020_1.txt": b"Hello, World!"})
+    assert list(output.columns) == ["source", "year", "text", "id", "title"]
+    assert all(dtype == "string[pyarrow]" for dtype in output.dtypes)
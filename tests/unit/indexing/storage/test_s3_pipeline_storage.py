@@ -0,0 +1,287 @@
+# Copyright (c) 2024 Microsoft Corporation.
+# Licensed under the MIT License
+"""S3 Storage Tests."""
+
+import io
+import re
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.response import StreamingBody
+from botocore.stub import ANY, Stubber
+
+from graphrag.index.storage.s3_pipeline_storage import (
+    MAX_POOL_CONNECTIONS_ENV,
+    S3PipelineStorage,
+    _FileFilter,
+    get_max_pool_connections,
+    get_transfer_manager,
+)
+
+
+def _body(data: bytes) -> StreamingBody:
+    return StreamingBody(io.BytesIO(data), len(data))
+
+
+async def test_get_small_object():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_response(
+            "get_object",
+            {"Body": _body(b"Hello, World!"), "ContentRange": "bytes 0-12/13"},
+            {"Bucket": "bucket", "Key": "prefix/test.txt", "Range": ANY},
+        )
+        output = await storage.get("test.txt")
+        stubber.assert_no_pending_responses()
+    assert output == "Hello, World!"
+
+
+def _serve_object(
+    client, payload: bytes, etag: str = '"v1"'
+) -> list[tuple[str, str | None]]:
+    """Answer ranged get_object calls from payload, recording each (Range, If-Match)."""
+    requests = []
+
+    def handler(params, **_kwargs):
+        headers = params["headers"]
+        requests.append((headers["Range"], headers.get("If-Match")))
+        start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+        end = min(end, len(payload) - 1)
+        chunk = payload[start : end + 1]
+        return AWSResponse(None, 206, {}, None), {
+            "Body": _body(chunk),
+            "ContentRange": f"bytes {start}-{end}/{len(payload)}",
+            "ETag": etag,
+        }
+
+    client.meta.events.register("before-call.s3.GetObject", handler)
+    return requests
+
+
+async def test_get_ranged_object():
+    client = boto3.client("s3", region_name="us-east-1")
+    storage = S3PipelineStorage(
+        bucket_name="bucket", chunksize=4, max_concurrency=2, client=client
+    )
+    requests = _serve_object(client, b"abcdefghijkl")
+    output = await storage.get("test.bin", as_bytes=True)
+    assert output == b"abcdefghijkl"
+    assert requests[0] == ("bytes=0-3", None)
+    assert sorted(requests[1:]) == [("bytes=4-7", '"v1"'), ("bytes=8-11", '"v1"')]
+
+
+async def test_get_ranged_object_short_last_range():
+    client = boto3.client("s3", region_name="us-east-1")
+    storage = S3PipelineStorage(
+        bucket_name="bucket", chunksize=4, max_concurrency=2, client=client
+    )
+    requests = _serve_object(client, b"abcdefghij")
+    output = await storage.get("test.bin", as_bytes=True)
+    assert output == b"abcdefghij"
+    assert sorted(requests[1:]) == [("bytes=4-7", '"v1"'), ("bytes=8-9", '"v1"')]
+
+
+async def test_get_missing_object():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_client_error("get_object", service_error_code="NoSuchKey")
+        output = await storage.get("missing.txt")
+    assert output is None
+
+
+def test_child():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    child = storage.child("output")
+    assert isinstance(child, S3PipelineStorage)
+    assert child.base_prefix == "prefix/output"
+    assert child.s3 is storage.s3
+    assert S3PipelineStorage(bucket_name="bucket").s3 is storage.s3
+
+
+def test_find_sharded():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        for shard in ["a", "b"]:
+            stubber.add_response(
+                "list_objects_v2",
+                {
+                    "Contents": [
+                        {"Key": f"prefix/{shard}1.txt"},
+                        {"Key": f"prefix/{shard}2.csv"},
+                    ]
+                },
+                {"Bucket": "bucket", "Prefix": ANY},
+            )
+        items = list(storage.find(re.compile(r".*\.txt$"), list_shards=["a", "b"]))
+        stubber.assert_no_pending_responses()
+    assert sorted(items) == [("prefix/a1.txt", {}), ("prefix/b1.txt", {})]
+
+
+def test_find_file_filter():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [
+                    {"Key": "prefix/news/2020_a.txt"},
+                    {"Key": "prefix/blog/2021_b.txt"},
+                    {"Key": "prefix/wiki/2021_c.txt"},
+                ]
+            },
+            {"Bucket": "bucket", "Prefix": "prefix"},
+        )
+        items = list(
+            storage.find(
+                re.compile(r".*/(?P<source>\w+)/(?P<year>\d{4})_\w\.txt$"),
+                file_filter={"source": ["news", "blog"], "year": r"202\d"},
+            )
+        )
+    assert [key for key, _ in items] == [
+        "prefix/news/2020_a.txt",
+        "prefix/blog/2021_b.txt",
+    ]
+
+
+def test_file_filter_reorders_by_selectivity():
+    file_filter = _FileFilter({"source": r"\w+", "year": "2020"}, reorder_interval=8)
+    for _ in range(8):
+        assert not file_filter.matches({"source": "news", "year": "2021"})
+    assert file_filter.matches({"source": "news", "year": "2020"})
+    assert file_filter.fields == ["year", "source"]
+
+
+async def test_clear():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": "prefix/a.txt"}, {"Key": "prefix/b.txt"}]},
+            {"Bucket": "bucket", "Prefix": "prefix"},
+        )
+        stubber.add_response(
+            "delete_objects",
+            {"Deleted": [{"Key": "prefix/a.txt"}, {"Key": "prefix/b.txt"}]},
+            {
+                "Bucket": "bucket",
+                "Delete": {
+                    "Objects": [{"Key": "prefix/a.txt"}, {"Key": "prefix/b.txt"}]
+                },
+            },
+        )
+        await storage.clear()
+        stubber.assert_no_pending_responses()
+
+
+async def test_get_prefixed_key():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        for _ in range(2):
+            stubber.add_response(
+                "get_object",
+                {"Body": _body(b"data"), "ContentRange": "bytes 0-3/4"},
+                {"Bucket": "bucket", "Key": "prefix/input/prefix.txt", "Range": ANY},
+            )
+        assert await storage.get("input/prefix.txt") == "data"
+        assert await storage.get("prefix/input/prefix.txt") == "data"
+        stubber.assert_no_pending_responses()
+
+
+async def test_afind():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_response(
+            "list_objects_v2",
+            {
+                "Contents": [{"Key": "prefix/a.txt"}, {"Key": "prefix/b.csv"}],
+                "IsTruncated": True,
+                "NextContinuationToken": "token",
+            },
+            {"Bucket": "bucket", "Prefix": "prefix"},
+        )
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": "prefix/c.txt"}]},
+            {"Bucket": "bucket", "Prefix": "prefix", "ContinuationToken": "token"},
+        )
+        items = [item async for item in storage.afind(re.compile(r".*\.txt$"))]
+        stubber.assert_no_pending_responses()
+    assert items == [("prefix/a.txt", {}), ("prefix/c.txt", {})]
+
+
+async def test_find_max_count():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    page = {"Contents": [{"Key": "prefix/a.txt"}, {"Key": "prefix/b.txt"}]}
+    with Stubber(storage.s3) as stubber:
+        for _ in range(2):
+            stubber.add_response("list_objects_v2", page, None)
+        items = list(storage.find(re.compile(r".*\.txt$"), max_count=1))
+        aitems = [
+            item async for item in storage.afind(re.compile(r".*\.txt$"), max_count=1)
+        ]
+        stubber.assert_no_pending_responses()
+    assert items == aitems == [("prefix/a.txt", {})]
+
+
+async def test_set():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_response(
+            "put_object",
+            {},
+            {"Bucket": "bucket", "Key": "prefix/test.txt", "Body": b"Hello, World!"},
+        )
+        await storage.set("test.txt", "Hello, World!", encoding="utf-8")
+        stubber.assert_no_pending_responses()
+
+
+async def test_set_multipart():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    child = storage.child("output")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_response(
+            "create_multipart_upload",
+            {"UploadId": "upload"},
+            {
+                "Bucket": "bucket",
+                "Key": "prefix/output/big.bin",
+                "ChecksumAlgorithm": ANY,
+            },
+        )
+        for part in range(2):
+            stubber.add_response("upload_part", {"ETag": f'"{part}"'}, None)
+        stubber.add_response("complete_multipart_upload", {}, None)
+        await child.set("big.bin", b"x" * (child.chunksize + 1))
+        stubber.assert_no_pending_responses()
+    assert get_transfer_manager(
+        child.s3, child.chunksize, child.max_concurrency
+    ) is get_transfer_manager(storage.s3, storage.chunksize, storage.max_concurrency)
+
+
+async def test_has_cached():
+    storage = S3PipelineStorage(bucket_name="bucket", base_prefix="prefix")
+    with Stubber(storage.s3) as stubber:
+        stubber.add_response(
+            "head_object", {}, {"Bucket": "bucket", "Key": "prefix/test.txt"}
+        )
+        assert await storage.has("test.txt")
+        assert await storage.has("test.txt")
+        stubber.assert_no_pending_responses()
+
+        stubber.add_response(
+            "delete_object", {}, {"Bucket": "bucket", "Key": "prefix/test.txt"}
+        )
+        stubber.add_client_error("head_object", http_status_code=404)
+        await storage.delete("test.txt")
+        assert not await storage.has("test.txt")
+        stubber.assert_no_pending_responses()
+
+
+def test_max_pool_connections(monkeypatch):
+    monkeypatch.setenv(MAX_POOL_CONNECTIONS_ENV, "128")
+    assert get_max_pool_connections() == 128
+    for value in ["many", "0", "-4"]:
+        monkeypatch.setenv(MAX_POOL_CONNECTIONS_ENV, value)
+        with pytest.raises(ValueError, match=f"{MAX_POOL_CONNECTIONS_ENV}.*'{value}'"):
+            get_max_pool_connections()